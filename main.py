@@ -1,6 +1,8 @@
 """
 Main entry point for Pokemon Radar Alert
 """
+import multiprocessing
+
 from src.utils import setup_logging, prevent_system_sleep
 from src.gui import PokemonRadarGUI
 
@@ -17,4 +19,6 @@ def main():
     app.run()
 
 if __name__ == "__main__":
+    # Required for the monitor worker process in frozen Windows builds
+    multiprocessing.freeze_support()
     main()
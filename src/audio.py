@@ -1,17 +1,35 @@
 """
 Audio functionality for alert sounds
 """
-import numpy as np
 import logging
-from .config import SOUND_FREQUENCY, SOUND_DURATION
+import os
+import threading
+from .config import SOUND_FREQUENCY, SOUND_DURATION, SOUND_SAMPLE_RATE, SOUND_BUFFER_SIZE
+
+# Pre-rendered alert tone (SOUND_FREQUENCY Hz for SOUND_DURATION s)
+ALERT_SOUND_FILE = os.path.join(os.path.dirname(__file__), "assets", "alert.wav")
+
+# Alert Sound objects shared by all AudioManager instances,
+# keyed by (frequency, duration, mixer rate, mixer channels)
+_SOUND_CACHE = {}
 
 class AudioManager:
     """Handles sound playback for alerts."""
     
+    # The pygame mixer is process-wide, so it is shared by every instance
+    _mixer_ready = False
+    _mixer_users = 0
+    _mixer_lock = threading.Lock()
+    
     def __init__(self):
         self.initialized = False
         self._pygame = None
-        self.setup_pygame()
+        self._alert_sound = None
+        self._mixer_rate = SOUND_SAMPLE_RATE
+        self._mixer_channels = 1
+        # pygame and the mixer are set up on the first alert to keep startup fast
+        self._init_lock = threading.Lock()
+        self._init_attempted = False
     
     def _get_pygame(self):
         """Import and cache pygame module."""
@@ -22,45 +40,102 @@ class AudioManager:
     
     def setup_pygame(self):
         """Initialize pygame for sound playback"""
+        registered = False
         try:
             pygame = self._get_pygame()
-            pygame.mixer.init()
+            with AudioManager._mixer_lock:
+                if not AudioManager._mixer_ready:
+                    # A larger buffer avoids underruns while the detection loop keeps the CPU busy
+                    pygame.mixer.pre_init(frequency=SOUND_SAMPLE_RATE, size=-16, channels=1, buffer=SOUND_BUFFER_SIZE)
+                    pygame.mixer.init()
+                    AudioManager._mixer_ready = True
+                AudioManager._mixer_users += 1
+                registered = True
+            # The device may not honour the requested rate; synthesize at the one it opened with
+            self._mixer_rate, _, self._mixer_channels = pygame.mixer.get_init()
+            self._alert_sound = self._load_alert_sound(pygame)
             self.initialized = True
             logging.info("Audio system initialized")
         except Exception as e:
-            logging.error(f"Failed to initialize audio: {e}")
+            logging.error("Failed to initialize audio: %s", e)
             self.initialized = False
+            if registered:
+                # cleanup() skips uninitialized managers, so give up our mixer use here
+                self._release_mixer()
+    
+    def _ensure_initialized(self) -> bool:
+        """Initialize the audio system on first use; return whether it is ready."""
+        if self.initialized:
+            return True
+        with self._init_lock:
+            if not self._init_attempted:
+                self._init_attempted = True
+                self.setup_pygame()
+        return self.initialized
+    
+    def _load_alert_sound(self, pygame):
+        """Load the alert tone once per process so each alert only has to play it."""
+        key = (SOUND_FREQUENCY, SOUND_DURATION, self._mixer_rate, self._mixer_channels)
+        sound = _SOUND_CACHE.get(key)
+        if sound is None:
+            if os.path.exists(ALERT_SOUND_FILE):
+                sound = pygame.mixer.Sound(ALERT_SOUND_FILE)
+            else:
+                logging.warning("Alert sound file not found, synthesizing tone: %s", ALERT_SOUND_FILE)
+                sound = self._build_alert_sound(pygame)
+            _SOUND_CACHE[key] = sound
+        return sound
+    
+    def _build_alert_sound(self, pygame):
+        """Synthesize the alert tone with numpy."""
+        import numpy as np
+        
+        sample_rate = self._mixer_rate
+        num_samples = int(sample_rate * SOUND_DURATION)
+        period = int(round(sample_rate / SOUND_FREQUENCY))
+        
+        # Synthesize a single period in float32 and repeat it to the full length
+        phase = np.arange(period, dtype=np.float32) * np.float32(2 * np.pi / period)
+        one_period = (np.sin(phase) * 32767).astype(np.int16)
+        sound = np.resize(one_period, num_samples)
+        
+        # The tone is identical on every channel; only duplicate it if the mixer
+        # could not be opened in mono
+        if self._mixer_channels > 1:
+            sound = np.ascontiguousarray(np.broadcast_to(sound[:, None], (num_samples, self._mixer_channels)))
+        
+        return pygame.sndarray.make_sound(sound)
+    
+    def _release_mixer(self):
+        """Drop this manager's use of the shared mixer, quitting it after the last user."""
+        with AudioManager._mixer_lock:
+            AudioManager._mixer_users -= 1
+            if AudioManager._mixer_users == 0 and AudioManager._mixer_ready:
+                # Cached sounds belong to the mixer being shut down
+                _SOUND_CACHE.clear()
+                self._pygame.mixer.quit()
+                AudioManager._mixer_ready = False
     
     def cleanup(self):
         """Clean up audio resources."""
         try:
             if self._pygame and self.initialized:
-                self._pygame.mixer.quit()
+                self._release_mixer()
+            self._alert_sound = None
             self.initialized = False
             logging.info("Audio system cleaned up")
         except Exception as e:
-            logging.error(f"Error during audio cleanup: {e}")
+            logging.error("Error during audio cleanup: %s", e)
     
     def play_alert_sound(self):
         """Play an alert sound"""
-        if not self.initialized:
+        if not self._ensure_initialized():
             print("\a")  # Fallback system beep
             return
         
         try:
-            pygame = self._get_pygame()
-            sample_rate = 44100
-            
-            t = np.linspace(0, SOUND_DURATION, int(sample_rate * SOUND_DURATION))
-            wave = np.sin(2 * np.pi * SOUND_FREQUENCY * t)
-            
-            sound = (wave * 32767).astype(np.int16)
-            stereo_sound = np.column_stack((sound, sound))
-            
-            sound_obj = pygame.sndarray.make_sound(stereo_sound)
-            sound_obj.play(loops=2)
-            
+            self._alert_sound.play(loops=2)
             logging.info("Alert sound played")
         except Exception as e:
-            logging.error(f"Could not play sound: {e}")
+            logging.error("Could not play sound: %s", e)
             print("\a")  # Fallback system beep
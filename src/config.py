@@ -12,10 +12,23 @@ DEFAULT_WHITE_THRESHOLD = 200
 DEFAULT_BLUE_THRESHOLD = 60.0
 DEFAULT_CHECK_INTERVAL = 0.5
 MIN_CONSECUTIVE_DETECTIONS = 2
+WHITE_DETECTION_PERCENTAGE = 0.1
+# Detection percentages are estimated from every Nth pixel in each direction
+ANALYSIS_STRIDE = 2
+ALERT_COOLDOWN = 2.0
 PREVIEW_SIZE = (150, 150)
+PREVIEW_REFRESH_INTERVAL = 0.1
+GUI_POLL_INTERVAL_MS = 50
+CONFIG_SAVE_DELAY_MS = 500
+MONITORS_CACHE_TTL = 5.0
 BLACK_PIXEL_WARNING_THRESHOLD = 95
 SOUND_FREQUENCY = 800
 SOUND_DURATION = 0.02
+SOUND_SAMPLE_RATE = 44100
+SOUND_BUFFER_SIZE = 4096
+LOG_FILE = 'pokemon_radar.log'
+LOG_MAX_BYTES = 5_000_000
+LOG_BACKUP_COUNT = 3
 
 @dataclass
 class MonitorConfig:
@@ -28,10 +41,8 @@ class MonitorConfig:
     blue_threshold: float = DEFAULT_BLUE_THRESHOLD
     check_interval: float = DEFAULT_CHECK_INTERVAL
 
-def get_default_coordinates():
-    """Get platform-appropriate default coordinates."""
-    system = platform.system()
-    
+def _platform_default_coordinates(system):
+    """Get default coordinates for the given platform name."""
     if system == "Darwin":  # macOS
         # macOS typically has menu bar at top, dock at bottom
         return {
@@ -55,3 +66,11 @@ def get_default_coordinates():
             "width": DEFAULT_MONITOR_SIZE,
             "height": DEFAULT_MONITOR_SIZE
         }
+
+# The platform cannot change while running, so resolve it once at import
+_SYSTEM = platform.system()
+_DEFAULT_COORDS = _platform_default_coordinates(_SYSTEM)
+
+def get_default_coordinates():
+    """Get platform-appropriate default coordinates."""
+    return _DEFAULT_COORDS.copy()
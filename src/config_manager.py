@@ -1,107 +1,150 @@
 """
 Configuration and preset management
 """
+import hashlib
 import json
 import os
 import logging
+from dataclasses import asdict, fields, replace
 from .config import MonitorConfig
 
+try:
+    import orjson
+except ImportError:  # Optional faster JSON backend
+    orjson = None
+
+_CONFIG_FIELDS = tuple(f.name for f in fields(MonitorConfig))
+
+def _dumps(data) -> bytes:
+    """Serialize data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+def _write_atomic(path: str, data: bytes):
+    """Write data to path via a temporary file so a crash never leaves a truncated file."""
+    tmp = path + '.tmp'
+    with open(tmp, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def _loads(raw: bytes):
+    """Parse JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 class ConfigManager:
     """Handles saving and loading of configuration and presets."""
     
     def __init__(self, presets_file="pokemon_radar_presets.json", config_file="pokemon_radar_config.json"):
         self.presets_file = presets_file
         self.config_file = config_file
-        self.presets = self.load_presets()
+        self._presets = None
+        self._presets_mtime = 0
+        self._config_cache = None
+        self._config_mtime = 0
+        # Digest of the configuration last written to (or read from) config_file
+        self._last_config_hash = None
+    
+    @property
+    def presets(self) -> dict:
+        """Presets by name, reloaded from disk whenever the file changes."""
+        return self.load_presets()
     
     def load_presets(self):
-        """Load presets from JSON file"""
+        """Load presets from JSON file, reusing the parsed copy if the file is unchanged"""
         try:
             if os.path.exists(self.presets_file):
-                with open(self.presets_file, 'r') as f:
-                    return json.load(f)
-            else:
-                return {}
+                mtime = os.stat(self.presets_file).st_mtime_ns
+                if mtime != self._presets_mtime or self._presets is None:
+                    with open(self.presets_file, 'rb') as f:
+                        self._presets = _loads(f.read())
+                    self._presets_mtime = mtime
+            elif self._presets is None:
+                self._presets = {}
         except Exception as e:
-            logging.error(f"Could not load presets: {e}")
-            return {}
+            logging.error("Could not load presets: %s", e)
+            if self._presets is None:
+                self._presets = {}
+        return self._presets
     
-    def save_presets(self):
-        """Save presets to JSON file"""
+    def save_presets(self) -> bool:
+        """Save presets to JSON file, returning whether the write succeeded"""
         try:
-            with open(self.presets_file, 'w') as f:
-                json.dump(self.presets, f, indent=2)
+            _write_atomic(self.presets_file, _dumps(self.presets))
+            self._presets_mtime = os.stat(self.presets_file).st_mtime_ns
+            return True
         except Exception as e:
-            logging.error(f"Could not save presets: {e}")
-            raise
+            logging.error("Could not save presets: %s", e)
+            return False
     
-    def add_preset(self, name: str, config: MonitorConfig):
-        """Add a new preset."""
-        self.presets[name] = {
-            "x": config.x,
-            "y": config.y,
-            "width": config.width,
-            "height": config.height,
-            "white_threshold": config.white_threshold,
-            "blue_threshold": config.blue_threshold,
-            "check_interval": config.check_interval
-        }
-        self.save_presets()
+    def add_preset(self, name: str, config: MonitorConfig) -> bool:
+        """Add a new preset, skipping the write if it is already stored unchanged."""
+        preset = asdict(config)
+        if self.presets.get(name) == preset:
+            return True
+        self.presets[name] = preset
+        return self.save_presets()
     
     def get_preset(self, name: str) -> dict:
         """Get a preset by name."""
         return self.presets.get(name)
     
-    def delete_preset(self, name: str):
+    def delete_preset(self, name: str) -> bool:
         """Delete a preset."""
         if name in self.presets:
             del self.presets[name]
-            self.save_presets()
+            return self.save_presets()
+        return True
     
     def get_preset_names(self) -> list:
         """Get list of all preset names."""
         return list(self.presets.keys())
     
-    def save_config_to_file(self, config: MonitorConfig):
-        """Save current configuration to file."""
-        config_data = {
-            "x": config.x,
-            "y": config.y,
-            "width": config.width,
-            "height": config.height,
-            "white_threshold": config.white_threshold,
-            "blue_threshold": config.blue_threshold,
-            "check_interval": config.check_interval
-        }
-        
+    def save_config_to_file(self, config: MonitorConfig) -> bool:
+        """Save current configuration to file if it changed since the last save."""
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(config_data, f, indent=2)
+            data = _dumps(asdict(config))
+            digest = hashlib.blake2b(data).digest()
+            if digest == self._last_config_hash:
+                return True
+            
+            _write_atomic(self.config_file, data)
+            self._last_config_hash = digest
             logging.info("Configuration saved to file")
+            return True
         except Exception as e:
-            logging.error(f"Failed to save configuration: {e}")
-            raise
+            logging.error("Failed to save configuration: %s", e)
+            return False
 
     def load_config_from_file(self) -> MonitorConfig:
-        """Load configuration from file."""
+        """Load configuration from file, reusing the parsed copy if the file is unchanged."""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r') as f:
-                    config_data = json.load(f)
+                mtime = os.stat(self.config_file).st_mtime_ns
+                if mtime == self._config_mtime and self._config_cache is not None:
+                    return replace(self._config_cache)
+                
+                with open(self.config_file, 'rb') as f:
+                    config_data = _loads(f.read())
                 
                 config = MonitorConfig()
-                config.x = config_data.get("x", config.x)
-                config.y = config_data.get("y", config.y)
-                config.width = config_data.get("width", config.width)
-                config.height = config_data.get("height", config.height)
-                config.white_threshold = config_data.get("white_threshold", config.white_threshold)
-                config.blue_threshold = config_data.get("blue_threshold", config.blue_threshold)
-                config.check_interval = config_data.get("check_interval", config.check_interval)
+                for key in _CONFIG_FIELDS:
+                    value = config_data.get(key)
+                    if value is not None:
+                        setattr(config, key, value)
                 
+                self._config_cache = config
+                self._config_mtime = mtime
+                # What is on disk already matches this config, so saving it unchanged is a no-op
+                self._last_config_hash = hashlib.blake2b(_dumps(asdict(config))).digest()
                 logging.info("Configuration loaded from file")
-                return config
+                return replace(config)
             except Exception as e:
-                logging.error(f"Failed to load configuration: {e}")
+                logging.error("Failed to load configuration: %s", e)
                 return MonitorConfig()
         else:
             return MonitorConfig()
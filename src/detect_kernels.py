@@ -0,0 +1,47 @@
+"""
+Optional Numba kernels for frame analysis
+"""
+import logging
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; ScreenMonitor falls back to OpenCV/NumPy
+    njit = None
+
+# OpenCV's fixed-point BGR->gray coefficients (Q15), so results match cv2.cvtColor
+_GRAY_B = 3735
+_GRAY_G = 19235
+_GRAY_R = 9798
+_GRAY_SHIFT = 15
+
+if njit is not None:
+    # Compiled eagerly for the frame type MSS produces so the first frame is not slow
+    @njit("UniTuple(int64, 3)(uint8[:, :, ::1], int64, int64)", parallel=True, nogil=True, cache=True)
+    def count_pixels_bgra(frame, white_threshold, stride):
+        """Count black, white and blue pixels of a BGRA frame in one pass.
+        
+        Only every ``stride``-th pixel of every ``stride``-th row is visited.
+        """
+        height = frame.shape[0]
+        width = frame.shape[1]
+        rows = (height + stride - 1) // stride
+        black = 0
+        white = 0
+        blue = 0
+        for i in prange(rows):
+            y = i * stride
+            for x in range(0, width, stride):
+                b = frame[y, x, 0]
+                g = frame[y, x, 1]
+                r = frame[y, x, 2]
+                if b < 10 and g < 10 and r < 10:
+                    black += 1
+                gray = (b * _GRAY_B + g * _GRAY_G + r * _GRAY_R + (1 << (_GRAY_SHIFT - 1))) >> _GRAY_SHIFT
+                if gray >= white_threshold:
+                    white += 1
+                if 75 <= b <= 155 and 70 <= g <= 155 and r <= 15:
+                    blue += 1
+        return black, white, blue
+else:
+    count_pixels_bgra = None
+    logging.info("Numba not available, using OpenCV frame analysis")
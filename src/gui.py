@@ -4,28 +4,93 @@ Main GUI application class
 import tkinter as tk
 from tkinter import messagebox, ttk, simpledialog
 import tkinter.scrolledtext as scrolledtext
-import threading
-import time
+import multiprocessing
+from multiprocessing import shared_memory
+import queue
+import functools
+import concurrent.futures
 import logging
+from dataclasses import asdict, replace
 from PIL import Image, ImageTk
 
-from .config import MonitorConfig, get_default_coordinates, PREVIEW_SIZE, MIN_CONSECUTIVE_DETECTIONS, BLACK_PIXEL_WARNING_THRESHOLD
-from .monitor import ScreenMonitor
+from .config import MonitorConfig, get_default_coordinates, PREVIEW_SIZE, GUI_POLL_INTERVAL_MS, CONFIG_SAVE_DELAY_MS, BLACK_PIXEL_WARNING_THRESHOLD
 from .audio import AudioManager
 from .config_manager import ConfigManager
 
+# Numeric settings inputs: config field -> parser
+_INPUT_FIELDS = {
+    "x": int,
+    "y": int,
+    "width": int,
+    "height": int,
+    "white_threshold": int,
+    "blue_threshold": float,
+    "check_interval": float,
+}
+
+@functools.lru_cache(maxsize=4)
+def _render_monitor_info(screen_width, screen_height, monitor_info, area):
+    """Render the monitor information text, cached per screen and area."""
+    x, y, width, height = area
+    return f"""Monitor Setup Information (MSS):
+
+{monitor_info}Total Virtual Screen Size: {screen_width} x {screen_height}
+
+MSS provides excellent multi-monitor support including:
+- Negative coordinates for left monitors
+- Full virtual desktop coverage
+- Better performance than PyAutoGUI
+
+For multi-monitor setups:
+- If your second monitor is on the LEFT of your primary monitor:
+  • X coordinates typically range from -{screen_width} to 0
+  • Y coordinates are usually 0 to {screen_height}
+  • Try starting with X = -{screen_width//2}, Y = 100
+
+- If your second monitor is on the RIGHT of your primary monitor:
+  • X coordinates typically range from {screen_width} to {screen_width*2}
+  • Y coordinates are usually 0 to {screen_height}
+
+Current Settings:
+X: {x}
+Y: {y}
+Width: {width}
+Height: {height}
+
+Tips for finding the right coordinates:
+1. Try these common left monitor coordinates:
+   • X: -{screen_width//2}, Y: {screen_height//4}
+   • X: -{screen_width}, Y: 0
+   • X: -{screen_width + 100}, Y: 100
+
+2. MSS handles negative coordinates much better than PyAutoGUI
+3. Use the monitor information above to see exact bounds
+4. Windows Display Settings shows monitor arrangement
+"""
+
 class PokemonRadarGUI:
     """Main GUI application for Pokemon Radar Alert."""
     
     def __init__(self):
         """Initialize the Pokemon Radar Alert application."""
         self.monitoring = False
-        self.monitor_thread = None
-        self.consecutive_detections = 0
+        self.monitor_process = None
+        # Updates from the monitor process, applied on the Tk thread by _pump_gui
+        self._gui_queue = None
+        self._stop_event = None
+        self._preview_shm = None
+        # Log records from the monitor process; private to it, so terminating
+        # the worker can never wedge the application's own log queue
+        self._worker_log_queue = None
         
-        # Initialize components
-        self.screen_monitor = ScreenMonitor()
-        self.audio_manager = AudioManager()
+        # Initialize components; capture and audio backends are created by
+        # _late_init once the window is on screen
+        self.screen_monitor = None
+        self.audio_manager = None
+        # The monitor module (OpenCV, NumPy) is imported after the window is up
+        self._monitor_module = None
+        # Alert playback runs off the Tk thread so a slow audio backend cannot stall the GUI
+        self._audio_pool = concurrent.futures.ThreadPoolExecutor(max_workers=1)
         self.config_manager = ConfigManager()
         
         # Configuration
@@ -42,16 +107,25 @@ class PokemonRadarGUI:
         if saved_config:
             self.config = saved_config
         
+        # Parsed input values, refreshed whenever an input is edited
+        self._cfg_cache = asdict(self.config)
+        self._input_errors = {}
+        self._save_after_id = None
+        
         # GUI variables
         self.root = None
         self.preview_label = None
         self.status_var = None
+        self._last_status = None
+        self._monitor_info_win = None
+        self._monitor_info_text = None
+        self._monitor_info_rendered = None
         
         try:
             self.setup_gui()
             logging.info("Pokemon Radar Alert initialized successfully")
         except Exception as e:
-            logging.error(f"Failed to initialize application: {e}")
+            logging.error("Failed to initialize application: %s", e)
             raise
     
     def setup_gui(self):
@@ -74,6 +148,29 @@ class PokemonRadarGUI:
         self._create_control_section()
         self._create_status_section()
         self._create_shortcuts_section()
+        
+        self.root.after(GUI_POLL_INTERVAL_MS, self._pump_gui)
+        self.root.after(10, self._late_init)
+    
+    def _late_init(self):
+        """Import and create the capture and audio backends after the window has been shown."""
+        try:
+            from . import monitor
+            self._monitor_module = monitor
+            self.screen_monitor = monitor.ScreenMonitor()
+            self.audio_manager = AudioManager()
+            self.start_button.configure(state="normal")
+            self._set_status("Ready to start monitoring")
+        except Exception as e:
+            logging.error("Failed to initialize backends: %s", e)
+            self._set_status(f"Failed to initialize: {e}")
+    
+    def _backends_ready(self) -> bool:
+        """Return whether _late_init has run, telling the user to wait if not."""
+        if self.screen_monitor is None:
+            self._set_status("Still loading, please wait...")
+            return False
+        return True
     
     def _create_title_section(self):
         """Create the title section."""
@@ -85,21 +182,10 @@ class PokemonRadarGUI:
         area_frame = tk.LabelFrame(self.root, text="Monitor Area", padx=10, pady=10)
         area_frame.pack(fill="x", padx=10, pady=5)
         
-        tk.Label(area_frame, text="X Position:").grid(row=0, column=0, sticky="w")
-        self.x_var = tk.StringVar(value=str(self.config.x))
-        tk.Entry(area_frame, textvariable=self.x_var, width=10).grid(row=0, column=1, padx=5)
-        
-        tk.Label(area_frame, text="Y Position:").grid(row=1, column=0, sticky="w")
-        self.y_var = tk.StringVar(value=str(self.config.y))
-        tk.Entry(area_frame, textvariable=self.y_var, width=10).grid(row=1, column=1, padx=5)
-        
-        tk.Label(area_frame, text="Width:").grid(row=2, column=0, sticky="w")
-        self.width_var = tk.StringVar(value=str(self.config.width))
-        tk.Entry(area_frame, textvariable=self.width_var, width=10).grid(row=2, column=1, padx=5)
-        
-        tk.Label(area_frame, text="Height:").grid(row=3, column=0, sticky="w")
-        self.height_var = tk.StringVar(value=str(self.config.height))
-        tk.Entry(area_frame, textvariable=self.height_var, width=10).grid(row=3, column=1, padx=5)
+        self.x_var = self._create_numeric_input(area_frame, 0, "X Position:", "x", -100000, 100000, 1)
+        self.y_var = self._create_numeric_input(area_frame, 1, "Y Position:", "y", -100000, 100000, 1)
+        self.width_var = self._create_numeric_input(area_frame, 2, "Width:", "width", 1, 100000, 1)
+        self.height_var = self._create_numeric_input(area_frame, 3, "Height:", "height", 1, 100000, 1)
         
         tk.Button(area_frame, text="Update Area", command=self.update_monitor_area).grid(row=4, column=0, columnspan=2, pady=5)
         tk.Button(area_frame, text="Test Area (Screenshot)", command=self.test_area).grid(row=5, column=0, columnspan=2, pady=2)
@@ -131,17 +217,32 @@ class PokemonRadarGUI:
         settings_frame = tk.LabelFrame(self.root, text="Detection Settings", padx=10, pady=10)
         settings_frame.pack(fill="x", padx=10, pady=5)
         
-        tk.Label(settings_frame, text="White Threshold (200-255):").grid(row=0, column=0, sticky="w")
-        self.threshold_var = tk.StringVar(value=str(self.config.white_threshold))
-        tk.Entry(settings_frame, textvariable=self.threshold_var, width=10).grid(row=0, column=1, padx=5)
-        
-        tk.Label(settings_frame, text="Blue Percentage Required (%):").grid(row=1, column=0, sticky="w")
-        self.blue_threshold_var = tk.StringVar(value=str(self.config.blue_threshold))
-        tk.Entry(settings_frame, textvariable=self.blue_threshold_var, width=10).grid(row=1, column=1, padx=5)
-        
-        tk.Label(settings_frame, text="Check Interval (seconds):").grid(row=2, column=0, sticky="w")
-        self.interval_var = tk.StringVar(value=str(self.config.check_interval))
-        tk.Entry(settings_frame, textvariable=self.interval_var, width=10).grid(row=2, column=1, padx=5)
+        self.threshold_var = self._create_numeric_input(
+            settings_frame, 0, "White Threshold (200-255):", "white_threshold", 0, 255, 1)
+        self.blue_threshold_var = self._create_numeric_input(
+            settings_frame, 1, "Blue Percentage Required (%):", "blue_threshold", 0, 100, 0.5)
+        self.interval_var = self._create_numeric_input(
+            settings_frame, 2, "Check Interval (seconds):", "check_interval", 0.05, 3600, 0.05)
+    
+    def _create_numeric_input(self, parent, row, label, field, from_, to, increment):
+        """Create a labelled spinbox for a numeric config field and return its variable."""
+        tk.Label(parent, text=label).grid(row=row, column=0, sticky="w")
+        var = tk.StringVar(value=str(getattr(self.config, field)))
+        spinbox = ttk.Spinbox(parent, textvariable=var, from_=from_, to=to, increment=increment, width=10)
+        if _INPUT_FIELDS[field] is int:
+            spinbox.configure(format="%.0f")
+        spinbox.grid(row=row, column=1, padx=5)
+        # Parse once per edit so later reads use the cached value
+        var.trace_add("write", lambda *args: self._parse_input(field, var))
+        return var
+    
+    def _parse_input(self, field, var):
+        """Parse an edited input into the config cache, remembering parse errors."""
+        try:
+            self._cfg_cache[field] = _INPUT_FIELDS[field](var.get())
+            self._input_errors.pop(field, None)
+        except ValueError as e:
+            self._input_errors[field] = str(e)
     
     def _create_preview_section(self):
         """Create the live preview section."""
@@ -150,6 +251,10 @@ class PokemonRadarGUI:
         
         self.preview_label = tk.Label(preview_frame, text="Click 'Start Monitoring' to see preview")
         self.preview_label.pack(expand=True)
+        
+        # One photo image reused for every preview frame
+        self._preview_photo = ImageTk.PhotoImage(Image.new("RGB", PREVIEW_SIZE))
+        self._preview_shown = False
     
     def _create_control_section(self):
         """Create the control buttons section."""
@@ -157,7 +262,7 @@ class PokemonRadarGUI:
         control_frame.pack(fill="x", padx=10, pady=10)
         
         self.start_button = tk.Button(control_frame, text="Start Monitoring", command=self.start_monitoring, 
-                                     bg="green", fg="white", font=("Arial", 12, "bold"))
+                                     bg="green", fg="white", font=("Arial", 12, "bold"), state="disabled")
         self.start_button.pack(side="left", fill="x", expand=True, padx=2)
         
         self.stop_button = tk.Button(control_frame, text="Stop Monitoring", command=self.stop_monitoring, 
@@ -166,10 +271,16 @@ class PokemonRadarGUI:
     
     def _create_status_section(self):
         """Create the status display section."""
-        self.status_var = tk.StringVar(value="Ready to start monitoring")
+        self.status_var = tk.StringVar(value="Loading capture and audio...")
         status_label = tk.Label(self.root, textvariable=self.status_var, relief="sunken", anchor="w")
         status_label.pack(fill="x", padx=10, pady=5)
     
+    def _set_status(self, message):
+        """Update the status bar, skipping redundant redraws of an unchanged message."""
+        if message != self._last_status:
+            self.status_var.set(message)
+            self._last_status = message
+    
     def _create_shortcuts_section(self):
         """Create the keyboard shortcuts info section."""
         shortcuts_frame = tk.Frame(self.root)
@@ -180,22 +291,18 @@ class PokemonRadarGUI:
     def validate_inputs(self):
         """Validate GUI input values."""
         try:
-            x = int(self.x_var.get())
-            y = int(self.y_var.get())
-            width = int(self.width_var.get())
-            height = int(self.height_var.get())
-            threshold = int(self.threshold_var.get())
-            blue_threshold = float(self.blue_threshold_var.get())
-            interval = float(self.interval_var.get())
+            if self._input_errors:
+                raise ValueError(next(iter(self._input_errors.values())))
             
             # Validate ranges
-            if width <= 0 or height <= 0:
+            cfg = self._cfg_cache
+            if cfg["width"] <= 0 or cfg["height"] <= 0:
                 raise ValueError("Width and height must be positive")
-            if not (0 <= threshold <= 255):
+            if not (0 <= cfg["white_threshold"] <= 255):
                 raise ValueError("White threshold must be between 0 and 255")
-            if not (0 <= blue_threshold <= 100):
+            if not (0 <= cfg["blue_threshold"] <= 100):
                 raise ValueError("Blue threshold must be between 0 and 100")
-            if interval <= 0:
+            if cfg["check_interval"] <= 0:
                 raise ValueError("Check interval must be positive")
                 
             return True
@@ -239,23 +346,29 @@ class PokemonRadarGUI:
             return
             
         try:
-            self.config.x = int(self.x_var.get())
-            self.config.y = int(self.y_var.get())
-            self.config.width = int(self.width_var.get())
-            self.config.height = int(self.height_var.get())
-            self.config.white_threshold = int(self.threshold_var.get())
-            self.config.blue_threshold = float(self.blue_threshold_var.get())
-            self.config.check_interval = float(self.interval_var.get())
+            self.config = replace(self.config, **self._cfg_cache)
             
-            # Save configuration automatically
-            self.config_manager.save_config_to_file(self.config)
+            # Save configuration automatically, debounced so bursts of updates write once
+            self._schedule_config_save()
             
-            self.status_var.set(f"Updated area: ({self.config.x}, {self.config.y}) {self.config.width}x{self.config.height}")
-            logging.info(f"Monitor area updated: {self.config}")
+            self._set_status(f"Updated area: ({self.config.x}, {self.config.y}) {self.config.width}x{self.config.height}")
+            logging.info("Monitor area updated: %s", self.config)
         except Exception as e:
-            logging.error(f"Failed to update monitor area: {e}")
+            logging.error("Failed to update monitor area: %s", e)
             messagebox.showerror("Error", f"Failed to update settings: {e}")
     
+    def _schedule_config_save(self):
+        """Save the configuration after CONFIG_SAVE_DELAY_MS without further updates."""
+        if self._save_after_id is not None:
+            self.root.after_cancel(self._save_after_id)
+        self._save_after_id = self.root.after(CONFIG_SAVE_DELAY_MS, self._save_config)
+    
+    def _save_config(self):
+        """Write the current configuration to file."""
+        self._save_after_id = None
+        if not self.config_manager.save_config_to_file(self.config):
+            messagebox.showerror("Error", "Settings were applied but could not be saved to file")
+    
     def save_current_as_preset(self):
         """Save current settings as a new preset"""
         self.update_monitor_area()
@@ -268,12 +381,11 @@ class PokemonRadarGUI:
             if not messagebox.askyesno("Overwrite Preset", f"Preset '{preset_name}' already exists. Overwrite?"):
                 return
         
-        try:
-            self.config_manager.add_preset(preset_name, self.config)
+        if self.config_manager.add_preset(preset_name, self.config):
             self.update_preset_dropdown()
-            self.status_var.set(f"Preset '{preset_name}' saved successfully")
-        except Exception as e:
-            messagebox.showerror("Error", f"Could not save preset: {e}")
+            self._set_status(f"Preset '{preset_name}' saved successfully")
+        else:
+            messagebox.showerror("Error", f"Could not save preset '{preset_name}'")
     
     def load_preset(self, preset_name):
         """Load a preset and update GUI"""
@@ -291,7 +403,7 @@ class PokemonRadarGUI:
         self.interval_var.set(str(preset["check_interval"]))
         
         self.update_monitor_area()
-        self.status_var.set(f"Loaded preset '{preset_name}'")
+        self._set_status(f"Loaded preset '{preset_name}'")
     
     def delete_selected_preset(self):
         """Delete the currently selected preset"""
@@ -301,12 +413,11 @@ class PokemonRadarGUI:
             return
         
         if messagebox.askyesno("Delete Preset", f"Are you sure you want to delete preset '{selected}'?"):
-            try:
-                self.config_manager.delete_preset(selected)
+            if self.config_manager.delete_preset(selected):
                 self.update_preset_dropdown()
-                self.status_var.set(f"Preset '{selected}' deleted")
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not delete preset: {e}")
+                self._set_status(f"Preset '{selected}' deleted")
+            else:
+                messagebox.showerror("Error", f"Could not delete preset '{selected}'")
     
     def update_preset_dropdown(self):
         """Update the preset dropdown with current presets"""
@@ -323,6 +434,9 @@ class PokemonRadarGUI:
     
     def test_area(self):
         """Take a screenshot of the monitoring area and show it"""
+        if not self._backends_ready():
+            return
+        
         try:
             if not self.validate_inputs():
                 return
@@ -339,7 +453,7 @@ class PokemonRadarGUI:
                     f"Screen size: {screen_width}x{screen_height}\n"
                     f"Your coordinates: ({self.config.x}, {self.config.y})")
             
-            screenshot = self.screen_monitor.take_screenshot(
+            screenshot = self.screen_monitor.take_screenshot_pil(
                 self.config.x, self.config.y, self.config.width, self.config.height)
             
             if screenshot is None:
@@ -355,162 +469,100 @@ class PokemonRadarGUI:
                     f"Try using 'Show Monitor Info' to find valid coordinates.")
             
             screenshot.show()
-            logging.info(f"Test screenshot taken: {black_percentage:.1f}% black pixels")
+            logging.info("Test screenshot taken: %.1f%% black pixels", black_percentage)
         except Exception as e:
-            logging.error(f"Could not take test screenshot: {e}")
+            logging.error("Could not take test screenshot: %s", e)
             messagebox.showerror("Error", f"Could not take screenshot: {str(e)}")
     
     def show_monitor_info(self):
         """Show information about monitor setup to help find correct coordinates"""
+        if not self._backends_ready():
+            return
+        
         try:
             screen_width, screen_height = self.screen_monitor.get_screen_size()
             monitor_info = self.screen_monitor.get_monitor_info()
             
-            info_window = tk.Toplevel(self.root)
-            info_window.title("Monitor Information")
-            info_window.geometry("500x400")
-            
-            text_widget = scrolledtext.ScrolledText(info_window, wrap=tk.WORD, width=60, height=25)
-            text_widget.pack(fill="both", expand=True, padx=10, pady=10)
+            info_text = _render_monitor_info(
+                screen_width, screen_height, monitor_info,
+                (self.config.x, self.config.y, self.config.width, self.config.height))
             
-            info_text = f"""Monitor Setup Information (MSS):
-
-{monitor_info}Total Virtual Screen Size: {screen_width} x {screen_height}
-
-MSS provides excellent multi-monitor support including:
-- Negative coordinates for left monitors
-- Full virtual desktop coverage
-- Better performance than PyAutoGUI
-
-For multi-monitor setups:
-- If your second monitor is on the LEFT of your primary monitor:
-  • X coordinates typically range from -{screen_width} to 0
-  • Y coordinates are usually 0 to {screen_height}
-  • Try starting with X = -{screen_width//2}, Y = 100
-
-- If your second monitor is on the RIGHT of your primary monitor:
-  • X coordinates typically range from {screen_width} to {screen_width*2}
-  • Y coordinates are usually 0 to {screen_height}
-
-Current Settings:
-X: {self.config.x}
-Y: {self.config.y}
-Width: {self.config.width}
-Height: {self.config.height}
-
-Tips for finding the right coordinates:
-1. Try these common left monitor coordinates:
-   • X: -{screen_width//2}, Y: {screen_height//4}
-   • X: -{screen_width}, Y: 0
-   • X: -{screen_width + 100}, Y: 100
-
-2. MSS handles negative coordinates much better than PyAutoGUI
-3. Use the monitor information above to see exact bounds
-4. Windows Display Settings shows monitor arrangement
-"""
+            # Build the window once; later calls re-show it and only refresh changed text
+            if self._monitor_info_win is None or not self._monitor_info_win.winfo_exists():
+                self._monitor_info_win = tk.Toplevel(self.root)
+                self._monitor_info_win.title("Monitor Information")
+                self._monitor_info_win.geometry("500x400")
+                self._monitor_info_win.protocol("WM_DELETE_WINDOW", self._monitor_info_win.withdraw)
+                
+                self._monitor_info_text = scrolledtext.ScrolledText(
+                    self._monitor_info_win, wrap=tk.WORD, width=60, height=25)
+                self._monitor_info_text.pack(fill="both", expand=True, padx=10, pady=10)
+                self._monitor_info_rendered = None
+            else:
+                self._monitor_info_win.deiconify()
+                self._monitor_info_win.lift()
             
-            text_widget.insert(tk.END, info_text)
-            text_widget.config(state=tk.DISABLED)
+            if info_text != self._monitor_info_rendered:
+                self._monitor_info_text.config(state=tk.NORMAL)
+                self._monitor_info_text.delete("1.0", tk.END)
+                self._monitor_info_text.insert(tk.END, info_text)
+                self._monitor_info_text.config(state=tk.DISABLED)
+                self._monitor_info_rendered = info_text
             
         except Exception as e:
             messagebox.showerror("Error", f"Could not show monitor info: {str(e)}")
     
-    def monitor_screen(self):
-        """Main monitoring loop"""
-        self.consecutive_detections = 0
-        error_count = 0
-        max_errors = 5
-        loop_times = []
-        
-        while self.monitoring:
-            loop_start = time.time()
-            
-            try:
-                screenshot = self.screen_monitor.take_screenshot(
-                    self.config.x, self.config.y, self.config.width, self.config.height)
-                
-                if screenshot is None:
-                    error_count += 1
-                    if error_count >= max_errors:
-                        self.status_var.set("Too many screenshot errors - stopping monitoring")
-                        self.stop_monitoring()
-                        return
-                    self.status_var.set(f"Error: Failed to take screenshot (attempt {error_count}/{max_errors})")
-                    time.sleep(self.config.check_interval)
-                    continue
-                
-                # Reset error count on successful screenshot
-                error_count = 0
-                
-                is_valid, black_percentage = self.screen_monitor.analyze_screenshot_quality(screenshot)
-                
-                if not is_valid:
-                    self.status_var.set(f"Warning: Screenshot is {black_percentage:.1f}% black - check coordinates!")
-                    time.sleep(self.config.check_interval)
-                    continue
-                
-                white_percentage = self.screen_monitor.detect_white_pixels(screenshot, self.config.white_threshold)
-                blue_percentage = self.screen_monitor.detect_blue_pixels(screenshot)
-                
-                # Update preview
-                try:
-                    preview_img = screenshot.resize(PREVIEW_SIZE, Image.Resampling.LANCZOS)
-                    photo = ImageTk.PhotoImage(preview_img)
-                    self.preview_label.configure(image=photo, text="")
-                    self.preview_label.image = photo
-                except Exception as e:
-                    logging.warning(f"Failed to update preview: {e}")
-                
-                white_detected = white_percentage > 0.1
-                blue_detected = blue_percentage >= self.config.blue_threshold
-                
-                # Track performance
-                loop_time = time.time() - loop_start
-                loop_times.append(loop_time)
-                
-                # Keep only last 10 measurements
-                if len(loop_times) > 10:
-                    loop_times.pop(0)
-                
-                avg_time = sum(loop_times) / len(loop_times)
-                
-                if white_detected and blue_detected:
-                    self.consecutive_detections += 1
-                    self.status_var.set(f"POKEMON DETECTED! {white_percentage:.1f}% white, {blue_percentage:.1f}% blue (detection #{self.consecutive_detections})")
-                    
-                    if self.consecutive_detections >= MIN_CONSECUTIVE_DETECTIONS:
-                        self.audio_manager.play_alert_sound()
-                        logging.info(f"Pokemon detected: {white_percentage:.1f}% white, {blue_percentage:.1f}% blue")
-                        time.sleep(2)
-                else:
-                    self.consecutive_detections = 0
-                    status_msg = f"Monitoring... {white_percentage:.1f}% white, {blue_percentage:.1f}% blue"
-                    if white_detected and not blue_detected:
-                        status_msg += " (White detected but insufficient blue)"
-                    elif blue_detected and not white_detected:
-                        status_msg += " (Blue detected but no white)"
-                    
-                    # Add performance info when not detecting
-                    status_msg += f" | Avg loop: {avg_time:.2f}s"
-                    self.status_var.set(status_msg)
-                
-                time.sleep(self.config.check_interval)
-                
-            except Exception as e:
-                error_count += 1
-                error_msg = f"Monitoring error ({error_count}/{max_errors}): {str(e)}"
-                self.status_var.set(error_msg)
-                logging.error(error_msg)
-                
-                if error_count >= max_errors:
-                    self.status_var.set("Too many errors - stopping monitoring")
+    def _drain_worker_logs(self):
+        """Pass log records queued by the monitor process to this process's handlers"""
+        try:
+            while self._worker_log_queue is not None:
+                record = self._worker_log_queue.get_nowait()
+                logging.getLogger(record.name).handle(record)
+        except queue.Empty:
+            pass
+        except Exception as e:
+            logging.warning("Failed to forward monitor log record: %s", e)
+    
+    def _pump_gui(self):
+        """Apply queued updates from the monitor process on the Tk thread"""
+        self._drain_worker_logs()
+        try:
+            while self._gui_queue is not None:
+                kind, value = self._gui_queue.get_nowait()
+                if kind == "status":
+                    self._set_status(value)
+                elif kind == "preview":
+                    if self.monitoring and self._preview_shm is not None:
+                        preview_img = Image.frombuffer("RGB", PREVIEW_SIZE, self._preview_shm.buf, "raw", "RGB", 0, 1)
+                        self._preview_photo.paste(preview_img)
+                        if not self._preview_shown:
+                            self.preview_label.configure(image=self._preview_photo, text="")
+                            self._preview_shown = True
+                elif kind == "alert":
+                    self._audio_pool.submit(self.audio_manager.play_alert_sound)
+                    logging.info(value)
+                elif kind == "stop":
                     self.stop_monitoring()
-                    return
-                
-                time.sleep(1)
+                    self._set_status(value)
+        except queue.Empty:
+            pass
+        except Exception as e:
+            logging.warning("Failed to apply GUI update: %s", e)
+        
+        # A worker that crashed cannot report it, so check it is still running
+        if self.monitoring and self.monitor_process is not None and not self.monitor_process.is_alive():
+            exit_code = self.monitor_process.exitcode
+            logging.error("Monitor process exited unexpectedly (exit code %s)", exit_code)
+            self.stop_monitoring()
+            self._set_status(f"Monitoring stopped: monitor process exited (exit code {exit_code})")
+        
+        self.root.after(GUI_POLL_INTERVAL_MS, self._pump_gui)
     
     def start_monitoring(self):
         """Start the monitoring process"""
+        if not self._backends_ready():
+            return
+        
         if not self.monitoring:
             # Validate configuration first
             is_valid, message = self.validate_configuration()
@@ -521,34 +573,67 @@ Tips for finding the right coordinates:
                 return
             
             self.update_monitor_area()
+            
+            # Detection runs in its own process; preview pixels come back through shared memory
+            self._preview_shm = shared_memory.SharedMemory(create=True, size=self._monitor_module.PREVIEW_NBYTES)
+            # Spawn rather than fork a process that already runs Tk and the log listener
+            ctx = multiprocessing.get_context("spawn")
+            self._gui_queue = ctx.Queue()
+            self._stop_event = ctx.Event()
+            self._worker_log_queue = ctx.Queue()
+            self.monitor_process = ctx.Process(
+                target=self._monitor_module.monitor_worker,
+                args=(replace(self.config), self._gui_queue, self._stop_event, self._preview_shm.name,
+                      self._worker_log_queue),
+                daemon=True)
+            self.monitor_process.start()
             self.monitoring = True
-            self.monitor_thread = threading.Thread(target=self.monitor_screen, daemon=True)
-            self.monitor_thread.start()
             
             self.start_button.configure(state="disabled")
             self.stop_button.configure(state="normal")
-            self.status_var.set("Monitoring started...")
+            self._set_status("Monitoring started...")
     
     def stop_monitoring(self):
         """Stop the monitoring process"""
         self.monitoring = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=1)
+        if self.monitor_process:
+            # The worker waits on this event between frames, so it exits promptly;
+            # terminate is only a fallback for a capture call that hangs
+            self._stop_event.set()
+            self.monitor_process.join(timeout=1)
+            if self.monitor_process.is_alive():
+                # May leave the worker's queues unusable, which is why they are discarded below
+                self.monitor_process.terminate()
+            else:
+                self._drain_worker_logs()
+            self.monitor_process = None
+        # Drop any updates the worker queued after being told to stop
+        self._gui_queue = None
+        self._worker_log_queue = None
+        
+        if self._preview_shm is not None:
+            self._preview_shm.close()
+            self._preview_shm.unlink()
+            self._preview_shm = None
         
         self.start_button.configure(state="normal")
         self.stop_button.configure(state="disabled")
-        self.status_var.set("Monitoring stopped")
+        self._set_status("Monitoring stopped")
         
         self.preview_label.configure(image="", text="Click 'Start Monitoring' to see preview")
+        self._preview_shown = False
     
     def cleanup_resources(self):
         """Clean up all resources."""
         try:
-            self.screen_monitor.cleanup()
-            self.audio_manager.cleanup()
+            if self.screen_monitor is not None:
+                self.screen_monitor.cleanup()
+            self._audio_pool.shutdown(wait=False)
+            if self.audio_manager is not None:
+                self.audio_manager.cleanup()
             logging.info("Resources cleaned up successfully")
         except Exception as e:
-            logging.error(f"Error during cleanup: {e}")
+            logging.error("Error during cleanup: %s", e)
     
     def run(self):
         """Start the GUI application"""
@@ -559,9 +644,13 @@ Tips for finding the right coordinates:
         """Handle window closing"""
         try:
             self.stop_monitoring()
+            # Flush a pending debounced config save
+            if self._save_after_id is not None:
+                self.root.after_cancel(self._save_after_id)
+                self._save_config()
             self.cleanup_resources()
             logging.info("Application closed successfully")
         except Exception as e:
-            logging.error(f"Error during application closure: {e}")
+            logging.error("Error during application closure: %s", e)
         finally:
             self.root.destroy()
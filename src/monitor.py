@@ -5,11 +5,45 @@ import numpy as np
 import cv2
 from PIL import Image
 import logging
-from .config import BLACK_PIXEL_WARNING_THRESHOLD
+import time
+from collections import deque
+from multiprocessing import shared_memory
+from .config import (BLACK_PIXEL_WARNING_THRESHOLD, PREVIEW_SIZE, PREVIEW_REFRESH_INTERVAL,
+                     MIN_CONSECUTIVE_DETECTIONS, WHITE_DETECTION_PERCENTAGE, ALERT_COOLDOWN,
+                     MONITORS_CACHE_TTL, ANALYSIS_STRIDE)
+from .utils import setup_worker_logging
 
 # Color detection ranges
-BLUE_LOWER = np.array([0, 70, 75])
-BLUE_UPPER = np.array([15, 155, 155])
+BLUE_LOWER = np.array([0, 70, 75], dtype=np.uint8)
+BLUE_UPPER = np.array([15, 155, 155], dtype=np.uint8)
+
+# The same ranges for raw BGRA frames from MSS (alpha unconstrained), as uint8
+# so cv2.inRange runs its 8-bit SIMD kernel without converting the bounds
+BLUE_LOWER_BGRA = np.array([75, 70, 0, 0], dtype=np.uint8)
+BLUE_UPPER_BGRA = np.array([155, 155, 15, 255], dtype=np.uint8)
+
+# Near-black range used for the screenshot quality check (all channels < 10)
+_BLACK_LO = np.zeros(3, dtype=np.uint8)
+_BLACK_HI = np.full(3, 9, dtype=np.uint8)
+_BLACK_LO_BGRA = np.zeros(4, dtype=np.uint8)
+_BLACK_HI_BGRA = np.array([9, 9, 9, 255], dtype=np.uint8)
+
+# RGB preview frame shared between the monitor worker and the GUI
+PREVIEW_SHAPE = (PREVIEW_SIZE[1], PREVIEW_SIZE[0], 3)
+PREVIEW_NBYTES = PREVIEW_SHAPE[0] * PREVIEW_SHAPE[1] * PREVIEW_SHAPE[2]
+
+def _decimate(img_array: np.ndarray, stride: int) -> np.ndarray:
+    """Keep every stride-th pixel in each direction, as a new contiguous image."""
+    if stride <= 1:
+        return img_array
+    # Samples the same ceil(n / stride) pixels per side as the Numba kernel,
+    # and never rounds a side down to nothing
+    return np.ascontiguousarray(img_array[::stride, ::stride])
+
+def _count_lut(gray: np.ndarray, lut: np.ndarray) -> int:
+    """Count pixels of a grayscale image the LUT maps to non-zero, in place."""
+    cv2.LUT(gray, lut, dst=gray)
+    return cv2.countNonZero(gray)
 
 class ScreenMonitor:
     """Handles screen capture and image analysis."""
@@ -17,6 +51,15 @@ class ScreenMonitor:
     def __init__(self):
         # Import MSS only when needed
         self._mss = None
+        self._kernel = None
+        self._kernel_loaded = False
+        self._frame_dtype_checked = False
+        # 256-entry white-threshold LUT and the threshold it was built for
+        self._white_lut = None
+        self._white_lut_threshold = None
+        # MSS monitor list and the monotonic time it was queried
+        self._monitors_cache = None
+        self._monitors_ts = 0.0
         # Use thread-local storage to ensure each thread gets its own MSS instance
         import threading
         self._thread_local = threading.local()
@@ -28,6 +71,23 @@ class ScreenMonitor:
             self._mss = mss
         return self._mss
     
+    def _get_kernel(self):
+        """Import and cache the fused Numba analysis kernel, if available."""
+        if not self._kernel_loaded:
+            from .detect_kernels import count_pixels_bgra
+            self._kernel = count_pixels_bgra
+            self._kernel_loaded = True
+        return self._kernel
+    
+    def _get_white_lut(self, threshold: int) -> np.ndarray:
+        """Return a LUT mapping gray levels >= threshold to 255, rebuilt on change."""
+        if threshold != self._white_lut_threshold:
+            lut = np.zeros(256, dtype=np.uint8)
+            lut[max(threshold, 0):] = 255
+            self._white_lut = lut
+            self._white_lut_threshold = threshold
+        return self._white_lut
+    
     def get_mss_instance(self):
         """Get or create MSS instance for screenshots (thread-safe)."""
         # Check if current thread has an MSS instance
@@ -42,22 +102,48 @@ class ScreenMonitor:
             self._thread_local.mss_instance.close()
             self._thread_local.mss_instance = None
     
-    def take_screenshot(self, x, y, width, height):
-        """Take screenshot using MSS for better multi-monitor support"""
+    def take_screenshot(self, x, y, width, height) -> np.ndarray:
+        """Take screenshot as a BGRA array viewing the MSS buffer without copying"""
         try:
             sct = self.get_mss_instance()
-            monitor = {"top": y, "left": x, "width": width, "height": height}
-            screenshot = sct.grab(monitor)
-            return Image.frombytes("RGB", screenshot.size, screenshot.bgra, "raw", "BGRX")
+            # The region rarely changes, so reuse this thread's monitor dict
+            local = self._thread_local
+            region = (x, y, width, height)
+            if getattr(local, 'last_region', None) != region:
+                local.last_region = region
+                local.last_monitor_dict = {"top": y, "left": x, "width": width, "height": height}
+            screenshot = sct.grab(local.last_monitor_dict)
+            return np.frombuffer(screenshot.raw, dtype=np.uint8).reshape(screenshot.height, screenshot.width, 4)
         except Exception as e:
-            logging.error(f"MSS screenshot failed: {e}")
-            return Image.new("RGB", (width, height), (0, 0, 0))
+            logging.error("MSS screenshot failed: %s", e)
+            return np.zeros((height, width, 4), dtype=np.uint8)
+    
+    def take_screenshot_pil(self, x, y, width, height) -> Image.Image:
+        """Take screenshot as an RGB PIL image, for display rather than analysis"""
+        frame = self.take_screenshot(x, y, width, height)
+        return Image.frombuffer("RGB", (frame.shape[1], frame.shape[0]), frame, "raw", "BGRX", 0, 1)
+    
+    def make_preview(self, frame: np.ndarray) -> np.ndarray:
+        """Downscale a BGRA frame to an RGB preview array"""
+        small = cv2.resize(frame, PREVIEW_SIZE, interpolation=cv2.INTER_AREA)
+        return cv2.cvtColor(small, cv2.COLOR_BGRA2RGB)
+    
+    def _get_monitors(self):
+        """Get the MSS monitor list, re-enumerating displays at most every MONITORS_CACHE_TTL seconds"""
+        now = time.monotonic()
+        if self._monitors_cache is None or now - self._monitors_ts >= MONITORS_CACHE_TTL:
+            self._monitors_cache = self.get_mss_instance().monitors[:]
+            self._monitors_ts = now
+        return self._monitors_cache
+    
+    def invalidate_monitors(self):
+        """Forget the cached monitor list so the next query re-enumerates displays."""
+        self._monitors_cache = None
     
     def get_screen_size(self):
         """Get the total screen size across all monitors using MSS"""
         try:
-            sct = self.get_mss_instance()
-            monitors = sct.monitors
+            monitors = self._get_monitors()
             if len(monitors) > 1:
                 virtual_monitor = monitors[0]
                 return virtual_monitor["width"], virtual_monitor["height"]
@@ -65,62 +151,275 @@ class ScreenMonitor:
                 primary = monitors[1] if len(monitors) > 1 else monitors[0]
                 return primary["width"], primary["height"]
         except Exception as e:
-            logging.error(f"Could not get screen size: {e}")
+            logging.error("Could not get screen size: %s", e)
             return 1920, 1080
     
     def get_monitor_info(self):
         """Get detailed monitor information."""
         try:
-            sct = self.get_mss_instance()
-            monitors = sct.monitors
-            info = f"Detected {len(monitors)} monitors:\n"
+            monitors = self._get_monitors()
+            parts = [f"Detected {len(monitors)} monitors:"]
             for i, monitor in enumerate(monitors):
                 if i == 0:
-                    info += f"  Virtual Screen: {monitor}\n"
+                    parts.append(f"  Virtual Screen: {monitor}")
                 else:
-                    info += f"  Monitor {i}: {monitor}\n"
-            return info
+                    parts.append(f"  Monitor {i}: {monitor}")
+            return "\n".join(parts) + "\n"
         except Exception as e:
             return f"Could not get detailed monitor info: {e}\n"
     
-    def detect_white_pixels(self, image: Image.Image, threshold: int) -> float:
-        """Detect white pixels in the image"""
+    def detect_white_pixels(self, image, threshold: int, stride: int = ANALYSIS_STRIDE) -> float:
+        """Detect white pixels in a PIL image or BGRA frame.
+        
+        The percentage is a statistical estimate taken from every ``stride``-th
+        pixel in each direction; pass ``stride=1`` for an exact count.
+        """
         try:
-            img_array = np.array(image)
-            gray = cv2.cvtColor(img_array, cv2.COLOR_RGB2GRAY)
-            
-            white_pixels = np.count_nonzero(gray >= threshold)
+            if isinstance(image, np.ndarray):
+                gray = cv2.cvtColor(_decimate(image, stride), cv2.COLOR_BGRA2GRAY)
+            else:
+                gray = cv2.cvtColor(_decimate(np.array(image), stride), cv2.COLOR_RGB2GRAY)
             total_pixels = gray.size
             
+            white_pixels = _count_lut(gray, self._get_white_lut(threshold))
+            
             return (white_pixels / total_pixels) * 100
         except Exception as e:
-            logging.error(f"Error detecting white pixels: {e}")
+            logging.error("Error detecting white pixels: %s", e)
             return 0.0
     
-    def detect_blue_pixels(self, image: Image.Image) -> float:
-        """Detect blue pixels in the image"""
+    def detect_blue_pixels(self, image, stride: int = ANALYSIS_STRIDE) -> float:
+        """Detect blue pixels in a PIL image or BGRA frame.
+        
+        The percentage is a statistical estimate taken from every ``stride``-th
+        pixel in each direction; pass ``stride=1`` for an exact count.
+        """
         try:
-            img_array = np.array(image)
-            
-            blue_mask = cv2.inRange(img_array, BLUE_LOWER, BLUE_UPPER)
-            blue_pixels = np.count_nonzero(blue_mask)
+            if isinstance(image, np.ndarray):
+                img_array = _decimate(image, stride)
+                blue_mask = cv2.inRange(img_array, BLUE_LOWER_BGRA, BLUE_UPPER_BGRA)
+            else:
+                img_array = _decimate(np.array(image), stride)
+                blue_mask = cv2.inRange(img_array, BLUE_LOWER, BLUE_UPPER)
+            blue_pixels = cv2.countNonZero(blue_mask)
             total_pixels = img_array.shape[0] * img_array.shape[1]
             
             return (blue_pixels / total_pixels) * 100
         except Exception as e:
-            logging.error(f"Error detecting blue pixels: {e}")
+            logging.error("Error detecting blue pixels: %s", e)
             return 0.0
     
-    def analyze_screenshot_quality(self, image: Image.Image) -> tuple[bool, float]:
-        """Analyze if screenshot appears valid (not mostly black)."""
+    def analyze(self, frame: np.ndarray, white_threshold: int,
+                stride: int = ANALYSIS_STRIDE) -> tuple[bool, float, float, float]:
+        """Run the quality, white and blue checks on one BGRA frame.
+        
+        Returns (is_valid, black_percentage, white_percentage, blue_percentage).
+        White and blue are only computed for valid screenshots, and without the
+        Numba kernel blue is reported as 0 when too little white was found.
+        Percentages are estimated from every ``stride``-th pixel in each direction.
+        Raises TypeError if frames are not uint8.
+        """
+        # Frames come from one capture path, so their dtype only needs checking once
+        if not self._frame_dtype_checked:
+            if frame.dtype != np.uint8:
+                raise TypeError(f"Expected uint8 frames, got {frame.dtype}")
+            self._frame_dtype_checked = True
         try:
-            img_array = np.array(image)
-            black_pixels = np.sum(np.all(img_array < 10, axis=2))
+            # No-op for MSS frames; guarantees the C-contiguous layout the kernels expect
+            frame = np.ascontiguousarray(frame)
+            
+            kernel = self._get_kernel()
+            if kernel is not None:
+                # Single fused pass over the sampled pixels of the frame
+                black_pixels, white_pixels, blue_pixels = kernel(frame, white_threshold, stride)
+                total_pixels = ((frame.shape[0] + stride - 1) // stride) * ((frame.shape[1] + stride - 1) // stride)
+            else:
+                frame = _decimate(frame, stride)
+                total_pixels = frame.shape[0] * frame.shape[1]
+                black_pixels = cv2.countNonZero(cv2.inRange(frame, _BLACK_LO_BGRA, _BLACK_HI_BGRA))
+                white_pixels = blue_pixels = None
+            
+            black_percentage = (black_pixels / total_pixels) * 100
+            if black_percentage > BLACK_PIXEL_WARNING_THRESHOLD:
+                return False, black_percentage, 0.0, 0.0
+            
+            if white_pixels is None:
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGRA2GRAY)
+                white_pixels = _count_lut(gray, self._get_white_lut(white_threshold))
+                
+                # Without white there is no detection, so skip the blue pass
+                if (white_pixels / total_pixels) * 100 > WHITE_DETECTION_PERCENTAGE:
+                    blue_mask = cv2.inRange(frame, BLUE_LOWER_BGRA, BLUE_UPPER_BGRA)
+                    blue_pixels = cv2.countNonZero(blue_mask)
+                else:
+                    blue_pixels = 0
+            
+            return (True, black_percentage,
+                    (white_pixels / total_pixels) * 100,
+                    (blue_pixels / total_pixels) * 100)
+        except Exception as e:
+            logging.error("Error analyzing screenshot: %s", e)
+            return False, 100.0, 0.0, 0.0
+    
+    def analyze_screenshot_quality(self, image) -> tuple[bool, float]:
+        """Analyze if a PIL image or BGRA frame appears valid (not mostly black)."""
+        try:
+            if isinstance(image, np.ndarray):
+                img_array = image
+                black_mask = cv2.inRange(img_array, _BLACK_LO_BGRA, _BLACK_HI_BGRA)
+            else:
+                img_array = np.array(image)
+                black_mask = cv2.inRange(img_array, _BLACK_LO, _BLACK_HI)
+            black_pixels = cv2.countNonZero(black_mask)
             total_pixels = img_array.shape[0] * img_array.shape[1]
             black_percentage = (black_pixels / total_pixels) * 100
             
             is_valid = black_percentage <= BLACK_PIXEL_WARNING_THRESHOLD
             return is_valid, black_percentage
         except Exception as e:
-            logging.error(f"Error analyzing screenshot quality: {e}")
+            logging.error("Error analyzing screenshot quality: %s", e)
             return False, 100.0
+
+
+def _wait_remaining(stop_event, interval, loop_start) -> bool:
+    """Wait for whatever is left of interval since loop_start (monotonic).
+    
+    Returns True as soon as stop_event is set.
+    """
+    return stop_event.wait(max(0.0, interval - (time.monotonic() - loop_start)))
+
+def monitor_worker(config, result_queue, stop_event, preview_name, log_queue=None):
+    """Monitoring loop, run in a separate process so detection does not compete with Tk for the GIL.
+    
+    Updates are sent to result_queue as (kind, value) tuples: "status", "alert",
+    "stop" and "preview". Preview pixels are written into the shared memory
+    block named preview_name rather than pickled through the queue. Log records
+    go to log_queue, which the GUI drains into its own handlers.
+    """
+    try:
+        setup_worker_logging(log_queue)
+        screen_monitor = ScreenMonitor()
+        # Importing the kernel compiles it; do that now rather than on the first frame
+        screen_monitor._get_kernel()
+        preview_shm = shared_memory.SharedMemory(name=preview_name)
+        preview_array = np.ndarray(PREVIEW_SHAPE, dtype=np.uint8, buffer=preview_shm.buf)
+    except Exception as e:
+        logging.error("Failed to start monitor worker: %s", e)
+        result_queue.put(("stop", f"Failed to start monitoring: {e}"))
+        return
+    
+    consecutive_detections = 0
+    # Alert once per rising edge of a detection ("idle" -> "alerted")
+    alert_state = "idle"
+    alert_cooldown_until = 0.0
+    error_count = 0
+    max_errors = 5
+    # Last 10 loop times plus their running sum
+    loop_times = deque(maxlen=10)
+    loop_sum = 0.0
+    last_preview_ts = 0.0
+    
+    # Bind the configuration and hot callables to locals once; the
+    # configuration is a snapshot that does not change while running
+    x, y, width, height = config.x, config.y, config.width, config.height
+    white_threshold = config.white_threshold
+    blue_threshold = config.blue_threshold
+    check_interval = config.check_interval
+    take_screenshot = screen_monitor.take_screenshot
+    analyze = screen_monitor.analyze
+    make_preview = screen_monitor.make_preview
+    push = result_queue.put
+    monotonic = time.monotonic
+    
+    try:
+        while not stop_event.is_set():
+            loop_start = monotonic()
+            
+            try:
+                frame = take_screenshot(x, y, width, height)
+                
+                if frame is None:
+                    error_count += 1
+                    if error_count >= max_errors:
+                        push(("stop", "Too many screenshot errors - stopping monitoring"))
+                        return
+                    push(("status", f"Error: Failed to take screenshot (attempt {error_count}/{max_errors})"))
+                    if _wait_remaining(stop_event, check_interval, loop_start):
+                        return
+                    continue
+                
+                # Reset error count on successful screenshot
+                error_count = 0
+                
+                is_valid, black_percentage, white_percentage, blue_percentage = analyze(
+                    frame, white_threshold)
+                
+                if not is_valid:
+                    push(("status", f"Warning: Screenshot is {black_percentage:.1f}% black - check coordinates!"))
+                    if _wait_remaining(stop_event, check_interval, loop_start):
+                        return
+                    continue
+                
+                # Update preview, throttled independently of the detection rate
+                now = monotonic()
+                if now - last_preview_ts >= PREVIEW_REFRESH_INTERVAL:
+                    last_preview_ts = now
+                    try:
+                        preview_array[...] = make_preview(frame)
+                        push(("preview", None))
+                    except Exception as e:
+                        logging.warning("Failed to update preview: %s", e)
+                
+                white_detected = white_percentage > WHITE_DETECTION_PERCENTAGE
+                blue_detected = blue_percentage >= blue_threshold
+                
+                # Track performance
+                loop_time = monotonic() - loop_start
+                if len(loop_times) == loop_times.maxlen:
+                    loop_sum -= loop_times[0]
+                loop_times.append(loop_time)
+                loop_sum += loop_time
+                
+                avg_time = loop_sum / len(loop_times)
+                
+                if white_detected and blue_detected:
+                    consecutive_detections += 1
+                    push(("status", f"POKEMON DETECTED! {white_percentage:.1f}% white, {blue_percentage:.1f}% blue (detection #{consecutive_detections})"))
+                    
+                    if (alert_state == "idle" and consecutive_detections >= MIN_CONSECUTIVE_DETECTIONS
+                            and loop_start >= alert_cooldown_until):
+                        push(("alert", f"Pokemon detected: {white_percentage:.1f}% white, {blue_percentage:.1f}% blue"))
+                        alert_state = "alerted"
+                        alert_cooldown_until = loop_start + ALERT_COOLDOWN
+                else:
+                    consecutive_detections = 0
+                    alert_state = "idle"
+                    status_msg = f"Monitoring... {white_percentage:.1f}% white, {blue_percentage:.1f}% blue"
+                    if white_detected and not blue_detected:
+                        status_msg += " (White detected but insufficient blue)"
+                    elif blue_detected and not white_detected:
+                        status_msg += " (Blue detected but no white)"
+                    
+                    # Add performance info when not detecting
+                    status_msg += f" | Avg loop: {avg_time:.2f}s"
+                    push(("status", status_msg))
+                
+                if _wait_remaining(stop_event, check_interval, loop_start):
+                    return
+                
+            except Exception as e:
+                error_count += 1
+                error_msg = f"Monitoring error ({error_count}/{max_errors}): {str(e)}"
+                push(("status", error_msg))
+                logging.error(error_msg)
+                
+                if error_count >= max_errors:
+                    push(("stop", "Too many errors - stopping monitoring"))
+                    return
+                
+                if stop_event.wait(1):
+                    return
+    finally:
+        screen_monitor.cleanup()
+        del preview_array
+        preview_shm.close()
@@ -1,10 +1,16 @@
 """
 System utilities for cross-platform functionality
 """
+import atexit
 import ctypes
+import ctypes.util
+import os
 import subprocess
 import platform
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from .config import LOG_FILE, LOG_MAX_BYTES, LOG_BACKUP_COUNT
 
 # Windows execution state constants (Windows only)
 if platform.system() == "Windows":
@@ -12,6 +18,44 @@ if platform.system() == "Windows":
     ES_SYSTEM_REQUIRED = 0x00000001
     ES_DISPLAY_REQUIRED = 0x00000002
 
+# macOS IOKit power assertion constants
+kCFStringEncodingUTF8 = 0x08000100
+kIOPMAssertionLevelOn = 255
+kIOPMAssertionTypeNoDisplaySleep = b"NoDisplaySleepAssertion"
+
+# IOKit assertion ID held for the lifetime of the process (macOS only)
+_mac_assertion_id = None
+
+def _create_mac_assertion():
+    """Hold an IOKit no-display-sleep assertion, like `caffeinate -d`."""
+    global _mac_assertion_id
+    core_foundation = ctypes.cdll.LoadLibrary(ctypes.util.find_library("CoreFoundation"))
+    iokit = ctypes.cdll.LoadLibrary(ctypes.util.find_library("IOKit"))
+    
+    core_foundation.CFStringCreateWithCString.restype = ctypes.c_void_p
+    core_foundation.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+    core_foundation.CFRelease.argtypes = [ctypes.c_void_p]
+    iokit.IOPMAssertionCreateWithName.restype = ctypes.c_int32
+    iokit.IOPMAssertionCreateWithName.argtypes = [ctypes.c_void_p, ctypes.c_uint32, ctypes.c_void_p,
+                                                  ctypes.POINTER(ctypes.c_uint32)]
+    iokit.IOPMAssertionRelease.argtypes = [ctypes.c_uint32]
+    
+    assertion_type = core_foundation.CFStringCreateWithCString(
+        None, kIOPMAssertionTypeNoDisplaySleep, kCFStringEncodingUTF8)
+    reason = core_foundation.CFStringCreateWithCString(None, b"Pokemon monitoring", kCFStringEncodingUTF8)
+    try:
+        assertion_id = ctypes.c_uint32(0)
+        result = iokit.IOPMAssertionCreateWithName(
+            assertion_type, kIOPMAssertionLevelOn, reason, ctypes.byref(assertion_id))
+    finally:
+        core_foundation.CFRelease(assertion_type)
+        core_foundation.CFRelease(reason)
+    if result != 0:
+        raise OSError(f"IOPMAssertionCreateWithName returned {result:#x}")
+    
+    _mac_assertion_id = assertion_id.value
+    atexit.register(iokit.IOPMAssertionRelease, _mac_assertion_id)
+
 def prevent_system_sleep():
     """Prevent system from going to sleep - cross-platform implementation."""
     system = platform.system()
@@ -23,36 +67,68 @@ def prevent_system_sleep():
             )
             logging.info("Windows sleep prevention enabled")
         except Exception as e:
-            logging.warning(f"Could not prevent Windows sleep: {e}")
+            logging.warning("Could not prevent Windows sleep: %s", e)
     
     elif system == "Darwin":  # macOS
+        if _mac_assertion_id is not None:
+            return
         try:
-            # Use caffeinate command on macOS
-            subprocess.Popen(['caffeinate', '-d'], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            logging.info("macOS sleep prevention enabled via caffeinate")
+            # Take the power assertion in-process, so it ends with us
+            _create_mac_assertion()
+            logging.info("macOS sleep prevention enabled via IOKit")
         except Exception as e:
-            logging.warning(f"Could not prevent macOS sleep: {e}")
+            logging.warning("IOKit power assertion failed, falling back to caffeinate: %s", e)
+            try:
+                # -w ties caffeinate to our PID so it cannot outlive the app
+                subprocess.Popen(['caffeinate', '-d', '-w', str(os.getpid())],
+                                 stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+                logging.info("macOS sleep prevention enabled via caffeinate")
+            except Exception as fallback_error:
+                logging.warning("Could not prevent macOS sleep: %s", fallback_error)
     
     elif system == "Linux":
         try:
             # Try to use systemd-inhibit on Linux
+            # The inhibitor lasts as long as its child; tail --pid exits with us
             subprocess.Popen(['systemd-inhibit', '--what=idle', '--who=pokemon-radar', 
-                            '--why=Pokemon monitoring', 'sleep', '999999'], 
+                            '--why=Pokemon monitoring', 'tail', f'--pid={os.getpid()}', '-f', '/dev/null'], 
                            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
             logging.info("Linux sleep prevention enabled via systemd-inhibit")
         except Exception as e:
-            logging.warning(f"Could not prevent Linux sleep: {e}")
+            logging.warning("Could not prevent Linux sleep: %s", e)
     
     else:
-        logging.warning(f"Sleep prevention not implemented for {system}")
+        logging.warning("Sleep prevention not implemented for %s", system)
 
 def setup_logging():
-    """Set up application logging."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('pokemon_radar.log'),
-            logging.StreamHandler()
-        ]
-    )
+    """Set up application logging.
+    
+    Records are only enqueued by the logging thread; a background listener
+    writes them to the console and a size-bounded rotating log file.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = RotatingFileHandler(LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, delay=True)
+    stream_handler = logging.StreamHandler()
+    file_handler.setFormatter(formatter)
+    stream_handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, file_handler, stream_handler)
+    listener.start()
+    # Flush whatever is still queued when the application exits
+    atexit.register(listener.stop)
+    
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+def setup_worker_logging(log_queue):
+    """Send a worker process's log records to log_queue, for the parent to handle."""
+    if log_queue is None:
+        return
+    root_logger = logging.getLogger()
+    # Drop handlers inherited from the parent; their listener does not run here
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))
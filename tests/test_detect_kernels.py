@@ -0,0 +1,47 @@
+"""
+Parity between the fused Numba kernel and the OpenCV analysis path
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("cv2")
+
+from src.detect_kernels import count_pixels_bgra
+from src.monitor import ScreenMonitor
+
+
+def _random_frame(height, width, seed=0):
+    return np.random.default_rng(seed).integers(0, 256, (height, width, 4), dtype=np.uint8)
+
+
+@pytest.mark.parametrize("stride", [1, 2])
+@pytest.mark.parametrize("shape", [(270, 480), (273, 151)])
+@pytest.mark.parametrize("white_threshold", [1, 128, 200])
+def test_kernel_matches_opencv_fallback(stride, shape, white_threshold):
+    # Thresholds leave enough white that the fallback also counts blue
+    if count_pixels_bgra is None:
+        pytest.skip("numba is not installed")
+    frame = _random_frame(*shape)
+    # Pixels inside the blue range, so the blue counts are exercised too
+    frame[::7, ::5, :3] = (100, 120, 5)
+
+    with_kernel = ScreenMonitor()
+    fallback = ScreenMonitor()
+    fallback._kernel = None
+    fallback._kernel_loaded = True
+
+    assert with_kernel._get_kernel() is count_pixels_bgra
+    assert (with_kernel.analyze(frame, white_threshold, stride)
+            == fallback.analyze(frame, white_threshold, stride))
+
+
+@pytest.mark.parametrize("stride", [1, 2, 4])
+def test_tiny_frames_are_analyzed(stride):
+    # A 1-pixel side must not be decimated away and reported as an invalid frame
+    frame = np.full((1, 3, 4), 255, dtype=np.uint8)
+    fallback = ScreenMonitor()
+    fallback._kernel = None
+    fallback._kernel_loaded = True
+
+    assert fallback.analyze(frame, 200, stride) == (True, 0.0, 100.0, 0.0)
+    assert fallback.detect_white_pixels(frame, 200, stride) == 100.0